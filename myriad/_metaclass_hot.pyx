@@ -0,0 +1,110 @@
+"""
+.. module:: _metaclass_hot
+:platform: Linux
+:synopsis: Optional Cython build of the MyriadMetaclass class-creation helpers
+.. moduleauthor:: Pedro Rittner <pr273@cornell.edu>
+
+Typed drop-in replacements for :func:`myriad_metaclass._parse_namespace` and
+:func:`myriad_metaclass._method_organizer_helper`, which run once per class
+and dominate class-creation time. Build in place with ``make cython``, and
+build and test it against the pure-Python versions with ``make test-cython``.
+
+When the extension is not built, :mod:`myriad_metaclass` silently keeps its
+pure-Python versions. Both must give the same results; when the extension
+is importable, tests/test_myriad_metaclass.py runs them side by side.
+"""
+
+import logging
+
+from .myriad_metaclass import LOG, _MyriadKind, _classify_type
+from .ast_function_assembler import pyfun_to_cfun
+from .myriad_utils import OrderedSet
+from .myriad_types import MyriadScalar, MyriadTimeseriesVector, MDouble
+
+cdef int _CLASS_METHOD = _MyriadKind.CLASS_METHOD
+cdef int _VERBATIM = _MyriadKind.VERBATIM
+
+
+def _method_organizer_helper(supercls, myriad_methods):
+    """ See :func:`myriad_metaclass._method_organizer_helper` """
+    cdef str m_ident
+    cdef int kind
+    cdef bint verbatim
+    cdef set parent_methods
+
+    # Convert methods; remember, items() returns a read-only view
+    for m_ident, method in myriad_methods.items():
+        # Process verbatim methods
+        kind = getattr(method, "_myriad_kind", 0)
+        verbatim = kind == _VERBATIM
+        # Check if verbatim methods have a docstring to use
+        if verbatim and (method.__doc__ is None or method.__doc__ == ""):
+            raise Exception("Verbatim method cannot have empty docstring")
+        # Parse method, converting the body only if not verbatim
+        myriad_methods[m_ident] = pyfun_to_cfun(method.original_fun, verbatim)
+        if kind == _CLASS_METHOD:
+            setattr(myriad_methods[m_ident], "is_myriadclass_method", True)
+
+    # Get parent method IDENTIFIERS - easier to check for existence
+    parent_methods = {v.ident for v in supercls._cached_all_methods}
+    LOG.debug("_method_organizer_helper parent methods: %r", parent_methods)
+
+    # 'Own methods' are methods we've created; everything else is inherited
+    own_methods = OrderedSet()
+    for m_ident, mtd in myriad_methods.items():
+        if m_ident in parent_methods or hasattr(mtd, "is_myriadclass_method"):
+            continue
+        own_methods.add(mtd)
+
+    LOG.debug("_method_organizer_helper own methods selected: %r", own_methods)
+    return own_methods
+
+
+def _parse_namespace(namespace, str name, myriad_methods, myriad_obj_vars):
+    """ See :func:`myriad_metaclass._parse_namespace` """
+    cdef str k
+    cdef str kind
+    cdef int myriad_kind
+    cdef bint log_debug = LOG.isEnabledFor(logging.DEBUG)
+
+    # Extracts variables and myriad methods from class definition
+    for k, val in namespace.items():
+        # ... a python meta value (e.g.  __module__) we shouldn't mess with
+        if k[0] == "_" and k.startswith("__"):
+            if log_debug:
+                LOG.debug("Built-in method %r ignored for %s", k, name)
+            continue
+        # ... a registered myriad method
+        myriad_kind = getattr(val, "_myriad_kind", 0)
+        if myriad_kind:
+            if log_debug:
+                LOG.debug("%s is a myriad method (%s) in %s",
+                          k, myriad_kind, name)
+            myriad_methods[k] = val
+            continue
+        kind = _classify_type(type(val))
+        # ... some generic non-Myriad function or method
+        if kind == "function":
+            if log_debug:
+                LOG.debug("%s is a function or method, ignoring for %s",
+                          k, name)
+        # ... some generic instance of a _MyriadBase type
+        elif kind == "myriad_base":
+            if log_debug:
+                LOG.debug("%s is a Myriad-type non-function attribute", k)
+            myriad_obj_vars[k] = val
+            if log_debug:
+                LOG.debug("%s was added as an object variable to %s", k, name)
+        # ... a type statement of base type MyriadCType (e.g. MDouble)
+        elif kind == "ctype":
+            myriad_obj_vars[k] = MyriadScalar(k, val)
+            if log_debug:
+                LOG.debug("%s has decl %s",
+                          k, myriad_obj_vars[k].stringify_decl())
+                LOG.debug("%s was added as an object variable to %s", k, name)
+        # ... a timeseries variable
+        elif val is MyriadTimeseriesVector:
+            myriad_obj_vars[k] = MyriadScalar(k, MDouble, arr_id="SIMUL_LEN")
+        else:
+            LOG.info("Unsupported var type for %r, ignoring in %s", k, name)
+    LOG.debug("myriad_obj_vars for %s: %s ", name, myriad_obj_vars)
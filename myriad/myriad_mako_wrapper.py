@@ -2,16 +2,109 @@
 Common wrapper for Mako templates
 """
 import os
+import shutil
+import stat
+import tempfile
 from io import StringIO
+from warnings import warn
 
+from pkg_resources import resource_filename
 from mako.template import Template
 from mako.runtime import Context
 from mako import exceptions
 
 
+#: Output file buffer size, so Mako's many small writes reach disk in bulk
+_FILE_BUFFER_SIZE = 128 * 1024
+
+#: Mode for newly generated files (temp files are created owner-only)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_NEW_FILE_MODE = 0o666 & ~_UMASK
+
+
+def template_module_directory():
+    """
+    Returns the directory where Mako keeps the Python modules generated from
+    packaged templates, so later processes import them instead of re-parsing
+    the template source, or None if that caching is disabled.
+
+    Caching is opt-in, enabled by setting MYRIAD_TEMPLATE_CACHE. Mako imports
+    whatever modules it finds there, so the per-user cache directory
+    ($XDG_CACHE_HOME/myriad, or ~/.cache/myriad) is created private and is
+    only used if it is a real directory owned by and private to this user.
+    """
+    if not os.environ.get("MYRIAD_TEMPLATE_CACHE"):
+        return None
+    cache_home = (os.environ.get("XDG_CACHE_HOME") or
+                  os.path.join(os.path.expanduser("~"), ".cache"))
+    module_dir = os.path.join(cache_home, "myriad")
+    try:
+        os.makedirs(module_dir, mode=0o700, exist_ok=True)
+        dir_stat = os.lstat(module_dir)
+    except OSError as ex:
+        warn("Template cache disabled: %s" % ex)
+        return None
+    getuid = getattr(os, "getuid", None)
+    if (not stat.S_ISDIR(dir_stat.st_mode) or
+            dir_stat.st_mode & (stat.S_IRWXG | stat.S_IRWXO) or
+            (getuid is not None and dir_stat.st_uid != getuid())):
+        warn("Template cache disabled: %s is not a private directory owned "
+             "by the current user" % module_dir)
+        return None
+    return module_dir
+
+
+def _same_bytes(filename: str, other_filename: str) -> bool:
+    """
+    Returns whether two files hold the same bytes. Compares contents directly
+    (unlike filecmp, which caches results by size and mtime), so any existing
+    file can be checked regardless of its encoding or timestamp.
+    """
+    if os.path.getsize(filename) != os.path.getsize(other_filename):
+        return False
+    with open(filename, 'rb') as filep, open(other_filename, 'rb') as other:
+        return filep.read() == other.read()
+
+
+class LazyTemplate(object):
+    """
+    A packaged Mako template, read and compiled only on first use.
+
+    The compiled module is cached across processes when enabled, see
+    template_module_directory.
+    """
+
+    __slots__ = ("template_name", "_template")
+
+    def __init__(self, template_name: str):
+        """ Records the template's file name in the templates directory """
+        self.template_name = template_name
+        self._template = None
+
+    def get(self) -> Template:
+        """ Returns the compiled template, compiling it first if needed """
+        if self._template is None:
+            self._template = Template(
+                filename=resource_filename(
+                    __name__, os.path.join("templates", self.template_name)),
+                module_directory=template_module_directory())
+        return self._template
+
+    def render(self, **context) -> str:
+        """ Renders the compiled template with the given context to a str """
+        try:
+            return self.get().render(**context)
+        except exceptions.MakoException:
+            print(exceptions.text_error_template().render())
+            return ""
+
+
 class MakoTemplate(object):
     """ Wraps a mako template, context, and I/O Buffer. """
 
+    __slots__ = ("_template", "_buffer", "_context_vars", "_context")
+
     def __init__(self, template, context=None, buf: StringIO=None):
         """ Initializes a template relevant data """
         # Sets template
@@ -19,51 +112,59 @@ class MakoTemplate(object):
         if isinstance(template, str):
             self._template = Template(template)
         elif isinstance(template, Template):
-            self._template = Template
+            self._template = template
         else:
             raise TypeError("Invalid template: expected string or Template")
 
-        # Set internal string buffer
+        # Set internal string buffer; allocated on first render if not given
         self._buffer = buf
-        if buf is None:
-            self._buffer = StringIO()
 
-        # Set context and context variables
-        context = context if context is not None else {}
-        self._context = Context(self._buffer, **context)
+        # Set context variables; the Context itself is built on first render
+        self._context_vars = dict(context) if context is not None else {}
+        self._context = None
 
     @property
     def buffer(self) -> str:
         """ Returns contents of string buffer """
-        return self._buffer.getvalue()
+        return self._buffer.getvalue() if self._buffer is not None else ""
 
     def reset_buffer(self):
         """ Refreshes the internal buffer and resets the context """
-        self._buffer = StringIO()
-        self._context = Context(self._buffer, **self._context.kwargs)
+        self._buffer = None
+        self._context = None
 
     @property
     def context(self) -> dict:
         """ Returns a copy of the internal context namespace as a dict """
-        return self._context.kwargs
+        return dict(self._context_vars)
 
     @context.setter
     def context(self, new_context: dict):
         """ Replaces current context with new context and refreshes buffer """
-        self._buffer = StringIO()
-        self._context = Context(self._buffer, **new_context)
+        self._context_vars = dict(new_context)
+        self.reset_buffer()
 
-    def render(self):
-        """ Renders the template to the internal buffer."""
+    def _render_context(self, context: Context):
+        """ Renders the template into the given context's output stream """
         try:
-            self._template.render_context(self._context)
+            self._template.render_context(context)
         except exceptions.MakoException:
             print(exceptions.text_error_template().render())
 
+    def render(self):
+        """ Renders the template to the internal buffer."""
+        if self._context is None:
+            if self._buffer is None:
+                self._buffer = StringIO()
+            self._context = Context(self._buffer, **self._context_vars)
+        self._render_context(self._context)
+
 
 class MakoFileTemplate(MakoTemplate):
     """ A MakoTemplate wrapper with file I/O functionality. """
 
+    __slots__ = ("filename",)
+
     def __init__(self,
                  filename: str,
                  template,
@@ -79,12 +180,38 @@ class MakoFileTemplate(MakoTemplate):
 
     def render_to_file(self, filename: str=None, overwrite: bool=True):
         """
-        Renders the template to a file with the given filename
+        Renders the template to a file with the given filename.
+
+        Output goes to a temporary file next to the target, which replaces it
+        only once rendering succeeds, so a failing template never leaves a
+        truncated file behind. An existing file whose contents already match
+        is left untouched, so its modification time doesn't trigger needless
+        rebuilds.
         """
         if filename is None:
             filename = self.filename
-        if not overwrite and os.path.isfile(filename):
+        exists = os.path.isfile(filename)
+        if exists and not overwrite:
             return
-        self.render()
-        with open(filename, 'w') as filep:
-            filep.write(self._buffer.getvalue())
+        # Replace the file a symlink points to rather than the link itself
+        filename = os.path.realpath(filename)
+        tmp_fd, tmp_filename = tempfile.mkstemp(
+            dir=os.path.dirname(filename), suffix=".tmp")
+        try:
+            with open(tmp_fd, 'w', buffering=_FILE_BUFFER_SIZE) as filep:
+                self._template.render_context(
+                    Context(filep, **self._context_vars))
+        except BaseException as ex:
+            os.remove(tmp_filename)
+            if not isinstance(ex, exceptions.MakoException):
+                raise
+            print(exceptions.text_error_template().render())
+            return
+        if exists and _same_bytes(filename, tmp_filename):
+            os.remove(tmp_filename)
+            return
+        if exists:
+            shutil.copymode(filename, tmp_filename)
+        else:
+            os.chmod(tmp_filename, _NEW_FILE_MODE)
+        os.replace(tmp_filename, filename)
@@ -107,16 +107,13 @@ inheritance tree.
 
 """
 
-import inspect
 import logging
-import os
 
 from collections import OrderedDict
-from copy import copy
-from functools import wraps
-from pkg_resources import resource_string
+from functools import lru_cache
+from types import FunctionType, MethodType
 
-from .myriad_mako_wrapper import MakoTemplate
+from .myriad_mako_wrapper import LazyTemplate
 from .myriad_utils import OrderedSet
 from .myriad_types import MyriadScalar, MyriadFunction, MyriadStructType
 from .myriad_types import _MyriadBase, MyriadCType, MyriadTimeseriesVector
@@ -134,30 +131,31 @@ LOG.addHandler(logging.NullHandler())
 # Constants #
 #############
 
-# Default include headers for all C files
-DEFAULT_LIB_INCLUDES = {"stdlib.h",
-                        "stdio.h",
-                        "assert.h",
-                        "string.h",
-                        "stddef.h",
-                        "stdarg.h",
-                        "stdint.h"}
+# Default include headers for all C files (shared, hence immutable)
+DEFAULT_LIB_INCLUDES = frozenset({"stdlib.h",
+                                  "stdio.h",
+                                  "assert.h",
+                                  "string.h",
+                                  "stddef.h",
+                                  "stdarg.h",
+                                  "stdint.h"})
 
 # Default include headers for CUDA files
-DEFAULT_CUDA_INCLUDES = {"cuda_runtime.h", "cuda_runtime_api.h"}
+DEFAULT_CUDA_INCLUDES = frozenset({"cuda_runtime.h", "cuda_runtime_api.h"})
+
+# Sorted once so generated #include order is stable across runs
+_LIB_INCLUDES = tuple(sorted(DEFAULT_LIB_INCLUDES))
+_CUDA_LIB_INCLUDES = tuple(sorted(DEFAULT_LIB_INCLUDES |
+                                  DEFAULT_CUDA_INCLUDES))
 
 
 #############
 # Templates #
 #############
 
-DELG_TEMPLATE = resource_string(
-    __name__,
-    os.path.join("templates", "delegator_func.mako")).decode("UTF-8")
+DELG_TEMPLATE = LazyTemplate("delegator_func.mako")
 
-SUPER_DELG_TEMPLATE = resource_string(
-    __name__,
-    os.path.join("templates", "super_delegator_func.mako")).decode("UTF-8")
+SUPER_DELG_TEMPLATE = LazyTemplate("super_delegator_func.mako")
 
 
 ######################
@@ -177,14 +175,13 @@ def create_delegator(instance_fxn: MyriadFunction,
     """
     # Create copy with modified identifier
     ist_cpy = MyriadFunction.from_myriad_func(instance_fxn)
-    # Generate template and render into copy's definition
-    template_vars = {"delegator": ist_cpy,
-                     "classname": classname,
-                     "MVoid": MVoid}
-    template = MakoTemplate(DELG_TEMPLATE, template_vars)
+    # Render template into copy's definition
     LOG.debug("Rendering create_delegator template for %s", classname)
-    template.render()
-    ist_cpy.fun_def = template.buffer
+    arg_idents = [arg.ident for arg in ist_cpy.args_list.values()]
+    ist_cpy.fun_def = DELG_TEMPLATE.render(delegator=ist_cpy,
+                                           classname=classname,
+                                           MVoid=MVoid,
+                                           fun_args=",".join(arg_idents[1:]))
     # Return created copy
     return ist_cpy
 
@@ -199,29 +196,47 @@ def create_super_delegator(delg_fxn: MyriadFunction,
 
     :return: Super delegator method as a MyriadFunction
     :rtype: MyriadFunction
+
+    :raises ValueError: if delg_fxn already has a parameter named _class
     """
+    # The class argument is keyed by name, so it can't share one with another
+    if "_class" in delg_fxn.args_list:
+        raise ValueError("Cannot create super delegator for {0}: parameter "
+                         "name _class is reserved".format(delg_fxn.ident))
     # Create copy of delegator function with modified parameters
-    super_args = copy(delg_fxn.args_list)
     super_class_arg = MyriadScalar("_class", MInt, False, ["const"])
-    tmp_arg_indx = len(super_args) + 1
-    super_args[tmp_arg_indx] = super_class_arg
-    super_args.move_to_end(tmp_arg_indx, last=False)
+    super_args = OrderedDict([("_class", super_class_arg)] +
+                             list(delg_fxn.args_list.items()))
     s_delg_f = MyriadFunction.from_myriad_func(delg_fxn,
                                                "super_" + delg_fxn.ident,
                                                super_args)
-    # Generate template and render
-    template_vars = {"delegator": delg_fxn,
-                     "super_delegator": s_delg_f,
-                     "classname": classname,
-                     "MVoid": MVoid}
-    template = MakoTemplate(SUPER_DELG_TEMPLATE, template_vars)
+    # Render template and add rendered definition to function
     LOG.debug("Rendering create_super_delegator template for %s", classname)
-    template.render()
-    # Add rendered definition to function
-    s_delg_f.fun_def = template.buffer
+    arg_idents = [arg.ident for arg in super_args.values()]
+    s_delg_f.fun_def = SUPER_DELG_TEMPLATE.render(
+        delegator=delg_fxn,
+        super_delegator=s_delg_f,
+        classname=classname,
+        MVoid=MVoid,
+        class_arg=arg_idents[0],
+        fun_args=",".join(arg_idents[1:]))
     return s_delg_f
 
 
+@lru_cache(maxsize=None)
+def _cached_delegators(method: MyriadFunction,
+                       classname: str) -> (MyriadFunction, MyriadFunction):
+    """
+    Returns the (delegator, super delegator) pair for a method of a class.
+
+    Rendering a class re-renders every class above it, so the same pair is
+    requested once per descendant; the rendered functions are only read by
+    the file templates and are therefore shared between calls.
+    """
+    return (create_delegator(method, classname),
+            create_super_delegator(method, classname))
+
+
 def gen_instance_method_from_str(delegator, m_name: str,
                                  method_body: str) -> MyriadFunction:
     """
@@ -243,9 +258,22 @@ def gen_instance_method_from_str(delegator, m_name: str,
 #####################
 
 
+class _MyriadKind(object):
+    """ Kinds of myriad methods, tagged by the decorators as _myriad_kind """
+    METHOD = 1
+    VERBATIM = 2
+    CLASS_METHOD = 3
+
+
 def myriad_method(method):
     """
     Tags a method in a class to be a myriad method (i.e. converted to a C func)
+
+    The method is tagged in place (its _myriad_kind and original_fun
+    attributes are set) and returned as is, not wrapped. Nothing therefore
+    stops it from being called directly from Python, which just runs the
+    Python body; myriad methods are only meant to be converted to C.
+
     NOTE: This MUST be the first decorator applied to the function! E.g.:
     `
     @another_decorator
@@ -253,16 +281,13 @@ def myriad_method(method):
     @myriad_method
     def my_fn(stuff):
     `
-    This is because decorators replace the wrapped function's signature.
+    This is because original_fun must be the undecorated function, whose
+    source and signature are what get converted.
     """
-    @wraps(method)
-    def inner(*args, **kwargs):
-        """ Dummy inner function to prevent direct method calls """
-        raise Exception("Cannot directly call a myriad method")
-    LOG.debug("myriad_method annotation wrapping %s", method.__name__)
-    setattr(inner, "is_myriad_method", True)
-    setattr(inner, "original_fun", method)
-    return inner
+    LOG.debug("myriad_method annotation tagging %s", method.__name__)
+    setattr(method, "_myriad_kind", _MyriadKind.METHOD)
+    setattr(method, "original_fun", method)
+    return method
 
 
 def myriad_method_verbatim(method):
@@ -270,6 +295,9 @@ def myriad_method_verbatim(method):
     Tags a method in a class to be a myriad method (i.e. converted to a C func)
     but takes the docstring as verbatim C code.
 
+    As with myriad_method, the method is tagged in place and returned as is,
+    so calling it directly from Python is not prevented.
+
     NOTE: This MUST be the first decorator applied to the function! E.g.:
     `
     @another_decorator
@@ -278,16 +306,12 @@ def myriad_method_verbatim(method):
     def my_fn(stuff):
     `
 
-    This is because decorators replace the wrapped function's signature.
+    This is because original_fun must be the undecorated function, whose
+    signature and docstring are what get converted.
     """
-    @wraps(method)
-    def inner(*args, **kwargs):
-        """ Dummy inner function to prevent direct method calls """
-        raise Exception("Cannot directly call a myriad method")
-    setattr(inner, "is_myriad_method_verbatim", True)
-    setattr(inner, "is_myriad_method", True)
-    setattr(inner, "original_fun", method)
-    return inner
+    setattr(method, "_myriad_kind", _MyriadKind.VERBATIM)
+    setattr(method, "original_fun", method)
+    return method
 
 
 #####################
@@ -298,6 +322,9 @@ def myriad_method_verbatim(method):
 class _MyriadObjectBase(object):
     """ Dummy placeholder class used for type checking, circular dependency"""
 
+    #: Flattened own_methods of this class and all its ancestors
+    _cached_all_methods = OrderedSet()
+
     @classmethod
     def _fill_in_base_methods(cls,
                               child_namespace: OrderedDict,
@@ -331,29 +358,22 @@ def _method_organizer_helper(supercls: _MyriadObjectBase,
     # Convert methods; remember, items() returns a read-only view
     for m_ident, method in myriad_methods.items():
         # Process verbatim methods
-        verbatim = hasattr(method, "is_myriad_method_verbatim")
+        kind = getattr(method, "_myriad_kind", 0)
+        verbatim = kind == _MyriadKind.VERBATIM
         # Check if verbatim methods have a docstring to use
         if verbatim and (method.__doc__ is None or method.__doc__ == ""):
             raise Exception("Verbatim method cannot have empty docstring")
         # Parse method, converting the body only if not verbatim
         myriad_methods[m_ident] = pyfun_to_cfun(method.original_fun, verbatim)
         # TODO: Use local var to avoid adding to own_methods (instead of attr)
-        if hasattr(method, "is_myriadclass_method"):
+        if kind == _MyriadKind.CLASS_METHOD:
             setattr(myriad_methods[m_ident], "is_myriadclass_method", True)
 
     # The important thing here is to decide which methods
     # (1) WE'VE CREATED, and
     # (2) Which methods are being OVERRRIDEN BY US that ORIGINATED ELSEWHERE
-    def get_parent_methods(cls: _MyriadObjectBase) -> OrderedSet:
-        """ Gets the own_methods of the parent class, and its parents, etc. """
-        # If we're MyriadObject, we don't have any parent methods
-        if cls is _MyriadObjectBase:
-            return OrderedSet()
-        else:
-            return cls.own_methods.union(get_parent_methods(cls.__bases__[0]))
-
     # Get parent method IDENTIFIERS - easier to check for existence
-    parent_methods = set([v.ident for v in get_parent_methods(supercls)])
+    parent_methods = set([v.ident for v in supercls._cached_all_methods])
     LOG.debug("_method_organizer_helper parent methods: %r", parent_methods)
 
     # 'Own methods' are methods we've created (1); everything else is (2)
@@ -367,22 +387,45 @@ def _method_organizer_helper(supercls: _MyriadObjectBase,
     return own_methods
 
 
-def _generate_includes(superclass) -> (set, set):
+def _generate_includes(superclass) -> (list, tuple):
     """ Generates local and lib includes based on superclass """
     lcl_inc = []
     if superclass is not _MyriadObjectBase:
         lcl_inc = [superclass.__name__ + ".cuh"]
     # TODO: Better detection of system/library headers
-    lib_inc = copy(DEFAULT_LIB_INCLUDES)
-    return (lcl_inc, lib_inc)
+    return (lcl_inc, _LIB_INCLUDES)
 
 
-def _generate_cuda_includes(superclass) -> (set, set):
+def _generate_cuda_includes(superclass) -> (list, tuple):
     """ Generates local and lib includes for a CUDA file """
     lcl_inc = []
     if superclass is not _MyriadObjectBase:
         lcl_inc = [superclass.__name__ + ".cuh"]
-    return (lcl_inc, DEFAULT_LIB_INCLUDES | DEFAULT_CUDA_INCLUDES)
+    return (lcl_inc, _CUDA_LIB_INCLUDES)
+
+
+#: Memoized classification of namespace value types, see _classify_type
+_NAMESPACE_TYPE_KINDS = {}
+
+
+def _classify_type(val_type: type) -> str:
+    """
+    Classifies a namespace value's type for _parse_namespace dispatch.
+
+    Results are memoized per type, so the subclass checks are done only once.
+    """
+    kind = _NAMESPACE_TYPE_KINDS.get(val_type)
+    if kind is None:
+        if issubclass(val_type, (FunctionType, MethodType)):
+            kind = "function"
+        elif issubclass(val_type, _MyriadBase):
+            kind = "myriad_base"
+        elif issubclass(val_type, MyriadCType):
+            kind = "ctype"
+        else:
+            kind = "other"
+        _NAMESPACE_TYPE_KINDS[val_type] = kind
+    return kind
 
 
 def _parse_namespace(namespace: dict,
@@ -395,42 +438,69 @@ def _parse_namespace(namespace: dict,
         2) OrderedDict of myriad_obj_vars
         3) OrderedSet of verbatim methods
     """
+    # Skip building debug messages entirely unless debug logging is on
+    log_debug = LOG.isEnabledFor(logging.DEBUG)
+    # Bind globals used in the loop to locals (LOAD_FAST vs. LOAD_GLOBAL)
+    _debug = LOG.debug
+    _getattr = getattr
+    _classify = _classify_type
+    _MScalar = MyriadScalar
+    _MTS = MyriadTimeseriesVector
+    _MD = MDouble
     # Extracts variables and myriad methods from class definition
     for k, val in namespace.items():
         # if val is ...
+        # ... a python meta value (e.g.  __module__) we shouldn't mess with
+        if k[0] == "_" and k.startswith("__"):
+            if log_debug:
+                _debug("Built-in method %r ignored for %s", k, name)
+            continue
         # ... a registered myriad method
-        if hasattr(val, "is_myriad_method"):
-            if hasattr(val, "is_myriadclass_method"):
-                LOG.debug("%s is a MyriadClass method in %s", k, name)
-            elif hasattr(val, "is_myriad_method_verbatim"):
-                LOG.debug("%s is a verbatim myriad method in %s", k, name)
-            else:
-                LOG.debug("%s is a myriad method in %s", k, name)
+        myriad_kind = _getattr(val, "_myriad_kind", 0)
+        if myriad_kind:
+            if log_debug:
+                _debug("%s is a myriad method (%s) in %s",
+                       k, myriad_kind, name)
             myriad_methods[k] = val
+            continue
+        kind = _classify(type(val))
         # ... some generic non-Myriad function or method
-        elif inspect.isfunction(val) or inspect.ismethod(val):
-            LOG.debug("%s is a function or method, ignoring for %s", k, name)
+        if kind == "function":
+            if log_debug:
+                _debug("%s is a function or method, ignoring for %s", k, name)
         # ... some generic instance of a _MyriadBase type
-        elif issubclass(val.__class__, _MyriadBase):
-            LOG.debug("%s is a Myriad-type non-function attribute", k)
+        elif kind == "myriad_base":
+            if log_debug:
+                _debug("%s is a Myriad-type non-function attribute", k)
             myriad_obj_vars[k] = val
-            LOG.debug("%s was added as an object variable to %s", k, name)
+            if log_debug:
+                _debug("%s was added as an object variable to %s", k, name)
         # ... a type statement of base type MyriadCType (e.g. MDouble)
-        elif issubclass(val.__class__, MyriadCType):
-            myriad_obj_vars[k] = MyriadScalar(k, val)
-            LOG.debug("%s has decl %s", k, myriad_obj_vars[k].stringify_decl())
-            LOG.debug("%s was added as an object variable to %s", k, name)
+        elif kind == "ctype":
+            myriad_obj_vars[k] = _MScalar(k, val)
+            if log_debug:
+                _debug("%s has decl %s",
+                       k, myriad_obj_vars[k].stringify_decl())
+                _debug("%s was added as an object variable to %s", k, name)
         # ... a timeseries variable
-        elif val is MyriadTimeseriesVector:
+        elif val is _MTS:
             # TODO: Enable different precisions for MyriadTimeseries
-            myriad_obj_vars[k] = MyriadScalar(k, MDouble, arr_id="SIMUL_LEN")
-        # ... a python meta value (e.g.  __module__) we shouldn't mess with
-        elif k.startswith("__"):
-            LOG.debug("Built-in method %r ignored for %s", k, name)
+            myriad_obj_vars[k] = _MScalar(k, _MD, arr_id="SIMUL_LEN")
         # TODO: Figure out other valid values for namespace variables
         else:
             LOG.info("Unsupported var type for %r, ignoring in %s", k, name)
-    LOG.debug("myriad_obj_vars for %s: %s ", name, myriad_obj_vars)
+    _debug("myriad_obj_vars for %s: %s ", name, myriad_obj_vars)
+
+
+# Pure-Python versions stay reachable, so the compiled ones can be checked
+_py_parse_namespace = _parse_namespace
+_py_method_organizer_helper = _method_organizer_helper
+
+# Prefer the Cython-compiled hot path if it was built (see _metaclass_hot.pyx)
+try:
+    from ._metaclass_hot import _parse_namespace, _method_organizer_helper
+except ImportError:
+    LOG.debug("_metaclass_hot not built, using pure-Python class creation")
 
 
 class MyriadMetaclass(type):
@@ -519,8 +589,15 @@ class MyriadMetaclass(type):
                                                    myriad_obj_vars)
 
         # Organize myriad methods and class struct members
-        namespace["own_methods"] = _method_organizer_helper(supercls,
-                                                            myriad_methods)
+        own_methods = OrderedSet()
+        if myriad_methods:
+            own_methods = _method_organizer_helper(supercls, myriad_methods)
+        namespace["own_methods"] = own_methods
+        # Classes adding no methods (common for leaves) share their parent's
+        namespace["_cached_all_methods"] = supercls._cached_all_methods
+        if own_methods:
+            namespace["_cached_all_methods"] =\
+                supercls._cached_all_methods | own_methods
 
         # Add #include's from system libraries, local files, and CUDA headers
         namespace["local_includes"], namespace["lib_includes"] =\
@@ -537,10 +614,9 @@ class MyriadMetaclass(type):
         # Fill in missing methods (ctor/etc.)
         supercls._fill_in_base_methods(namespace, myriad_methods)
 
-        # Finally, delete function from namespace
-        for method_id in myriad_methods.keys():
-            if method_id in namespace:
-                del namespace[method_id]
+        # Finally, delete functions from namespace
+        for method_id in myriad_methods.keys() & namespace.keys():
+            del namespace[method_id]
 
         # Generate internal module representation
         namespace["__init__"] = MyriadMetaclass.myriad_init
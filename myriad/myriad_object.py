@@ -4,16 +4,15 @@ Definition of the parent MyriadObject, from which all Myriad types inherit.
 import logging
 import os
 from collections import OrderedDict
-from pkg_resources import resource_string
 from pycparser.c_ast import ArrayDecl
 
-from .myriad_mako_wrapper import MakoTemplate, MakoFileTemplate
+from .myriad_mako_wrapper import MakoFileTemplate, LazyTemplate
 from .myriad_types import MyriadScalar, MyriadFunction
 from .myriad_types import MVoid, MVarArgs, MInt
 from .myriad_types import c_decl_to_pybuildarg
 from .myriad_metaclass import _MyriadObjectBase
 from .myriad_metaclass import myriad_method_verbatim, MyriadMetaclass
-from .myriad_metaclass import create_delegator, create_super_delegator
+from .myriad_metaclass import _cached_delegators
 from .myriad_utils import get_all_subclasses
 
 #######
@@ -24,37 +23,26 @@ LOG = logging.getLogger(__name__)
 LOG.addHandler(logging.NullHandler())
 
 
-#############################
-# Template Resource Strings #
-#############################
+#############
+# Templates #
+#############
 
-MYRIADOBJECT_PYC_FILE_TEMPLATE = resource_string(
-    __name__,
-    os.path.join("templates", "pymyriadobject.c.mako")).decode("UTF-8")
+MYRIADOBJECT_PYC_FILE_TEMPLATE = LazyTemplate("pymyriadobject.c.mako")
 
-MYRIADOBJECT_PYH_FILE_TEMPLATE = resource_string(
-    __name__,
-    os.path.join("templates", "pymyriadobject.h.mako")).decode("UTF-8")
+MYRIADOBJECT_PYH_FILE_TEMPLATE = LazyTemplate("pymyriadobject.h.mako")
 
-CTOR_TEMPLATE = resource_string(
-    __name__,
-    os.path.join("templates", "ctor_template.mako")).decode("UTF-8")
+CTOR_TEMPLATE = LazyTemplate("ctor_template.mako")
 
-INIT_OB_FUN_TEMPLATE = resource_string(
-    __name__,
-    os.path.join("templates", "init_ob_fun.mako")).decode("UTF-8")
+INIT_OB_FUN_TEMPLATE = LazyTemplate("init_ob_fun.mako")
 
-CUH_FILE_TEMPLATE = resource_string(
-    __name__,
-    os.path.join("templates", "cuh_file.mako")).decode("UTF-8")
+CUH_FILE_TEMPLATE = LazyTemplate("cuh_file.mako")
 
-CU_FILE_TEMPLATE = resource_string(
-    __name__,
-    os.path.join("templates", "cu_file.mako")).decode("UTF-8")
+CU_FILE_TEMPLATE = LazyTemplate("cu_file.mako")
 
-PYC_COMP_FILE_TEMPLATE = resource_string(
-    __name__,
-    os.path.join("templates", "pyc_file.mako")).decode("UTF-8")
+PYC_COMP_FILE_TEMPLATE = LazyTemplate("pyc_file.mako")
+
+#: Output kinds understood by MyriadObject.render_templates
+ALL_OUTPUTS = ("cuh", "cu", "pyc")
 
 
 class MyriadObject(_MyriadObjectBase,
@@ -109,38 +97,32 @@ class MyriadObject(_MyriadObjectBase,
     @classmethod
     def gen_init_funs(cls):
         """ Generates the init* functions for modules as a big string """
-        # Make temporary dictionary since we need to add an extra value
-        tmp_dict = {
-            "own_methods": getattr(cls, "own_methods"),
-            "our_subclasses":  get_all_subclasses(cls)}
-        template = MakoTemplate(INIT_OB_FUN_TEMPLATE, tmp_dict)
-        LOG.debug("Rendering init functions for TODO")
-        template.render()
-        setattr(cls, "init_functions", template.buffer)
+        LOG.debug("Rendering init functions for %s", cls.__name__)
+        init_functions = INIT_OB_FUN_TEMPLATE.render(
+            own_methods=getattr(cls, "own_methods"),
+            our_subclasses=get_all_subclasses(cls))
+        setattr(cls, "init_functions", init_functions)
 
     @classmethod
-    def _template_creator_helper(cls, template_dir=None):
+    def _template_creator_helper(cls, template_dir=None, outputs=ALL_OUTPUTS):
         """
-        Initializes templates for the current class
+        Initializes the requested output templates for the current class
         """
         # Set template directory
         template_dir = template_dir if template_dir else os.getcwd()
         # Create empty local namespace
         local_namespace = {}
-        # Get values from class namespace
-        own_methods = getattr(cls, "own_methods")
+        # Get values from class namespace; the templates walk own_methods and
+        # our_subclasses several times, so materialize them once as tuples
+        own_methods = tuple(getattr(cls, "own_methods"))
         cls_name = getattr(cls, "cls_name")
         obj_name = getattr(cls, "obj_name")
         obj_struct = getattr(cls, "obj_struct")
         # Initialize delegators/superdelegators in local namespace
-        own_method_delgs = []
-        for method in own_methods:
-            own_method_delgs.append(
-                (create_delegator(method, cls_name),
-                 create_super_delegator(method, cls_name)))
-        local_namespace["own_method_delgs"] = own_method_delgs
+        local_namespace["own_method_delgs"] = [
+            _cached_delegators(method, cls_name) for method in own_methods]
         # Fill local namespace with values we need for template rendering
-        local_namespace["own_methods"] = getattr(cls, "own_methods")
+        local_namespace["own_methods"] = own_methods
         local_namespace["cls_name"] = getattr(cls, "cls_name")
         local_namespace["obj_name"] = getattr(cls, "obj_name")
         local_namespace["obj_struct"] = getattr(cls, "obj_struct")
@@ -148,25 +130,30 @@ class MyriadObject(_MyriadObjectBase,
         local_namespace["init_functions"] = getattr(cls, "init_functions")
         local_namespace["local_includes"] = getattr(cls, "local_includes")
         local_namespace["lib_includes"] = getattr(cls, "lib_includes")
-        local_namespace["myriad_classes"] = MyriadMetaclass.myriad_classes
-        local_namespace["our_subclasses"] = get_all_subclasses(cls)
+        local_namespace["myriad_classes"] = tuple(
+            MyriadMetaclass.myriad_classes)
+        local_namespace["our_subclasses"] = tuple(get_all_subclasses(cls))
         if cls is not MyriadObject:
             local_namespace["super_obj_name"] = getattr(cls, "super_obj_name")
         else:
             local_namespace["super_obj_name"] = None
         # Render main file templates
-        setattr(cls, "cuh_file_template",
-                MakoFileTemplate(
-                    os.path.join(template_dir.name, obj_name + ".cuh"),
-                    CUH_FILE_TEMPLATE,
-                    local_namespace))
-        LOG.debug("cuh_file_template done for %s", obj_name)
-        setattr(cls, "cu_file_template",
-                MakoFileTemplate(
-                    os.path.join(template_dir.name, obj_name + ".cu"),
-                    CU_FILE_TEMPLATE,
-                    local_namespace))
-        LOG.debug("cu_file_template done for %s", obj_name)
+        if "cuh" in outputs:
+            setattr(cls, "cuh_file_template",
+                    MakoFileTemplate(
+                        os.path.join(template_dir.name, obj_name + ".cuh"),
+                        CUH_FILE_TEMPLATE.get(),
+                        local_namespace))
+            LOG.debug("cuh_file_template done for %s", obj_name)
+        if "cu" in outputs:
+            setattr(cls, "cu_file_template",
+                    MakoFileTemplate(
+                        os.path.join(template_dir.name, obj_name + ".cu"),
+                        CU_FILE_TEMPLATE.get(),
+                        local_namespace))
+            LOG.debug("cu_file_template done for %s", obj_name)
+        if "pyc" not in outputs:
+            return
         # Initialize object struct conversion for CPython getter methods
         # Ignores superclass (_), class object, and array declarations
         # Places result in local namespace to avoid collisions/for efficiency
@@ -180,44 +167,62 @@ class MyriadObject(_MyriadObjectBase,
         setattr(cls, "pyc_file_template",
                 MakoFileTemplate(
                     os.path.join(template_dir.name, "py" + obj_name.lower() + ".c"),
-                    PYC_COMP_FILE_TEMPLATE,
+                    PYC_COMP_FILE_TEMPLATE.get(),
                     local_namespace))
         LOG.debug("pyc_file_template done for %s", obj_name)
 
     @classmethod
-    def render_templates(cls, template_dir=None):
-        """ Render internal templates to files"""
+    def render_templates(cls, template_dir=None, outputs=ALL_OUTPUTS):
+        """
+        Render internal templates to files
+
+        :param outputs: Which of ALL_OUTPUTS to render (default: all of them)
+        :raises ValueError: if outputs names anything not in ALL_OUTPUTS
+        """
+        unknown_outputs = set(outputs) - set(ALL_OUTPUTS)
+        if unknown_outputs:
+            raise ValueError("Unknown template outputs {0}, expected some of "
+                             "{1}".format(sorted(unknown_outputs), ALL_OUTPUTS))
         # Get template rendering directory
         template_dir = template_dir if template_dir else os.getcwd()
-        # Render templates for the superclass
-        if cls is not MyriadObject:
-            # Render init functions now that we have complete RTTI
-            cls.gen_init_funs()
-            getattr(cls.__bases__[0], "render_templates")(template_dir)
-        # Prepare templates for rendering by collecting subclass information
-        cls._template_creator_helper(template_dir)
-        # Render templates for the current class
-        LOG.debug("Rendering CUH File for %s", cls.__name__)
-        getattr(cls, "cuh_file_template").render_to_file(overwrite=False)
-        LOG.debug("Rendering CU file for %s", cls.__name__)
-        getattr(cls, "cu_file_template").render_to_file(overwrite=False)
-        # MyriadObject has its own special pyc/pyh files
-        if cls is MyriadObject:
-            LOG.debug("Rendering PYC File for MyriadObject")
-            c_template = MakoFileTemplate(
-                os.path.join(template_dir.name, "pymyriadobject.c"),
-                MYRIADOBJECT_PYC_FILE_TEMPLATE,
-                cls.__dict__)
-            c_template.render_to_file(overwrite=False)
-            LOG.debug("Rendering PYH File for MyriadObject")
-            h_template = MakoFileTemplate(
-                os.path.join(template_dir.name, "pymyriadobject.h"),
-                MYRIADOBJECT_PYH_FILE_TEMPLATE,
-                cls.__dict__)
-            h_template.render_to_file(overwrite=False)
-        else:
-            LOG.debug("Rendering PYC File for %s", cls.__name__)
-            getattr(cls, "pyc_file_template").render_to_file(overwrite=False)
+        # Class hierarchy from MyriadObject down to us, walked once
+        chain = [c for c in reversed(cls.__mro__)
+                 if issubclass(c, MyriadObject)]
+        # Render init functions now that we have complete RTTI
+        # (only the CU file includes them)
+        if "cu" in outputs:
+            for mcls in chain[1:]:
+                mcls.gen_init_funs()
+        for mcls in chain:
+            # Prepare templates for rendering by collecting subclass info
+            mcls._template_creator_helper(template_dir, outputs)
+            # Render templates for the current class
+            if "cuh" in outputs:
+                LOG.debug("Rendering CUH File for %s", mcls.__name__)
+                getattr(mcls, "cuh_file_template").render_to_file(
+                    overwrite=False)
+            if "cu" in outputs:
+                LOG.debug("Rendering CU file for %s", mcls.__name__)
+                getattr(mcls, "cu_file_template").render_to_file(
+                    overwrite=False)
+            if "pyc" not in outputs:
+                continue
+            # MyriadObject has its own special pyc/pyh files
+            if mcls is MyriadObject:
+                LOG.debug("Rendering PYC File for MyriadObject")
+                c_template = MakoFileTemplate(
+                    os.path.join(template_dir.name, "pymyriadobject.c"),
+                    MYRIADOBJECT_PYC_FILE_TEMPLATE.get())
+                c_template.render_to_file(overwrite=False)
+                LOG.debug("Rendering PYH File for MyriadObject")
+                h_template = MakoFileTemplate(
+                    os.path.join(template_dir.name, "pymyriadobject.h"),
+                    MYRIADOBJECT_PYH_FILE_TEMPLATE.get())
+                h_template.render_to_file(overwrite=False)
+            else:
+                LOG.debug("Rendering PYC File for %s", mcls.__name__)
+                getattr(mcls, "pyc_file_template").render_to_file(
+                    overwrite=False)
 
     @classmethod
     def _fill_in_base_methods(cls,
@@ -230,10 +235,11 @@ class MyriadObject(_MyriadObjectBase,
         """
         # Fill in ctor if it's missing
         if "ctor" not in myriad_methods:
-            template = MakoTemplate(CTOR_TEMPLATE, child_namespace)
             LOG.debug("Rendering ctor template for %s",
                       child_namespace["obj_name"])
-            template.render()
             myriad_methods["ctor"] = MyriadFunction.from_myriad_func(
                 getattr(cls, "myriad_methods")["ctor"],
-                fun_def=template.buffer)
+                fun_def=CTOR_TEMPLATE.render(
+                    obj_name=child_namespace["obj_name"],
+                    super_obj_name=child_namespace["super_obj_name"],
+                    myriad_obj_vars=child_namespace["myriad_obj_vars"]))
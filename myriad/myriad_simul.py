@@ -12,9 +12,8 @@ import time
 from pprint import pprint
 from tempfile import TemporaryDirectory
 from copy import copy
-from pkg_resources import resource_string
 
-from .myriad_mako_wrapper import MakoFileTemplate
+from .myriad_mako_wrapper import MakoFileTemplate, LazyTemplate
 from .myriad_metaclass import MyriadMetaclass
 
 #############
@@ -22,55 +21,37 @@ from .myriad_metaclass import MyriadMetaclass
 #############
 
 #: Template for makefile (used for building C backend)
-MAKEFILE_TEMPLATE = resource_string(
-    __name__, "templates" + os.sep + "Makefile.mako").decode("UTF-8")
+MAKEFILE_TEMPLATE = LazyTemplate("Makefile.mako")
 
 #: Template for setup.py (used for building CPython extension modules)
-SETUPPY_TEMPLATE = resource_string(
-    __name__, "templates" + os.sep + "setup.py.mako").decode("UTF-8")
+SETUPPY_TEMPLATE = LazyTemplate("setup.py.mako")
 
 #: Template for main.c (main executable C file)
-MAIN_TEMPLATE = resource_string(
-    __name__, "templates" + os.sep + "main.c.mako").decode("UTF-8")
+MAIN_TEMPLATE = LazyTemplate("main.c.mako")
 
 #: Template for myriad.h (main parameter/macro file)
-MYRIAD_H_TEMPLATE = resource_string(
-    __name__, "templates" + os.sep + "myriad.h.mako").decode("UTF-8")
+MYRIAD_H_TEMPLATE = LazyTemplate("myriad.h.mako")
 
 #: Template for pymyriad.h (main CPython interface file)
-PYMYRIAD_H_TEMPLATE = resource_string(
-    __name__,
-    "templates" + os.sep + "pymyriad.h.mako").decode("UTF-8")
+PYMYRIAD_H_TEMPLATE = LazyTemplate("pymyriad.h.mako")
 
 #: Template for myriad_alloc.c (myriad memory allocator utility implementation)
-MYRIAD_ALLOC_C_TEMPLATE = resource_string(
-    __name__,
-    "templates" + os.sep + "myriad_alloc.c.mako").decode("UTF-8")
+MYRIAD_ALLOC_C_TEMPLATE = LazyTemplate("myriad_alloc.c.mako")
 
 #: Template for myriad_alloc.h (myriad memory allocator utility header)
-MYRIAD_ALLOC_H_TEMPLATE = resource_string(
-    __name__,
-    "templates" + os.sep + "myriad_alloc.h.mako").decode("UTF-8")
+MYRIAD_ALLOC_H_TEMPLATE = LazyTemplate("myriad_alloc.h.mako")
 
 #: Template for myriad_communicator.c (myriad UDP socket API for IPC impl)
-MYRIAD_COMMUNICATOR_C_TEMPLATE = resource_string(
-    __name__,
-    "templates" + os.sep + "myriad_communicator.c.mako").decode("UTF-8")
+MYRIAD_COMMUNICATOR_C_TEMPLATE = LazyTemplate("myriad_communicator.c.mako")
 
 #: Template for myriad_communicator.c (myriad UDP socket API for IPC header)
-MYRIAD_COMMUNICATOR_H_TEMPLATE = resource_string(
-    __name__,
-    "templates" + os.sep + "myriad_communicator.h.mako").decode("UTF-8")
+MYRIAD_COMMUNICATOR_H_TEMPLATE = LazyTemplate("myriad_communicator.h.mako")
 
 #: Template for pmyriad.c (myriad Python 'glue' for object interpretation)
-PYMYRIAD_C_TEMPLATE = resource_string(
-    __name__,
-    "templates" + os.sep + "pymyriad.c.mako").decode("UTF-8")
+PYMYRIAD_C_TEMPLATE = LazyTemplate("pymyriad.c.mako")
 
 #: Template for pymyriad_commuinicator.c (myriad Python 'glue' for IPC)
-PYMYRIAD_COMMUNICATOR_C_TEMPLATE = resource_string(
-    __name__,
-    "templates" + os.sep + "pymyriad_communicator.c.mako").decode("UTF-8")
+PYMYRIAD_COMMUNICATOR_C_TEMPLATE = LazyTemplate("pymyriad_communicator.c.mako")
 
 #######
 # Log #
@@ -291,11 +272,11 @@ class MyriadSimul(_MyriadSimulParent, metaclass=_MyriadSimulMeta):
         # Render templates into template_dir
         self._makefile_tmpl = MakoFileTemplate(
             template_dir_name + "Makefile",
-            MAKEFILE_TEMPLATE,
+            MAKEFILE_TEMPLATE.get(),
             final_params)
         self._setuppy_tmpl = MakoFileTemplate(
             template_dir_name + "setup.py",
-            SETUPPY_TEMPLATE,
+            SETUPPY_TEMPLATE.get(),
             {"dependencies": getattr(self, "dependencies")})
         # Main file template
         main_tmpl_context = {
@@ -305,39 +286,39 @@ class MyriadSimul(_MyriadSimulParent, metaclass=_MyriadSimulMeta):
         main_tmpl_context.update(final_params)
         self._main_tmpl = MakoFileTemplate(
             template_dir_name + "main.cu",
-            MAIN_TEMPLATE,
+            MAIN_TEMPLATE.get(),
             main_tmpl_context)
         self._myriad_h_tmpl = MakoFileTemplate(
             template_dir_name + "myriad.h",
-            MYRIAD_H_TEMPLATE,
+            MYRIAD_H_TEMPLATE.get(),
             final_params)
         self._pymyriad_h_tmpl = MakoFileTemplate(
             template_dir_name + "pymyriad.h",
-            PYMYRIAD_H_TEMPLATE,
+            PYMYRIAD_H_TEMPLATE.get(),
             final_params)
         self._myriad_alloc_c_tmpl = MakoFileTemplate(
             template_dir_name + "myriad_alloc.c",
-            MYRIAD_ALLOC_C_TEMPLATE,
+            MYRIAD_ALLOC_C_TEMPLATE.get(),
             final_params)
         self._myriad_alloc_h_tmpl = MakoFileTemplate(
             template_dir_name + "myriad_alloc.h",
-            MYRIAD_ALLOC_H_TEMPLATE,
+            MYRIAD_ALLOC_H_TEMPLATE.get(),
             final_params)
         self._myriad_communicator_c_tmpl = MakoFileTemplate(
             template_dir_name + "myriad_communicator.c",
-            MYRIAD_COMMUNICATOR_C_TEMPLATE,
+            MYRIAD_COMMUNICATOR_C_TEMPLATE.get(),
             final_params)
         self._myriad_communicator_h_tmpl = MakoFileTemplate(
             template_dir_name + "myriad_communicator.h",
-            MYRIAD_COMMUNICATOR_H_TEMPLATE,
+            MYRIAD_COMMUNICATOR_H_TEMPLATE.get(),
             final_params)
         self._pymyriad_c_tmpl = MakoFileTemplate(
             template_dir_name + "pymyriad.c",
-            PYMYRIAD_C_TEMPLATE,
+            PYMYRIAD_C_TEMPLATE.get(),
             final_params)
         self._pymyriad_communicator_c_tmpl = MakoFileTemplate(
             template_dir_name + "pymyriad_communicator.c",
-            PYMYRIAD_COMMUNICATOR_C_TEMPLATE,
+            PYMYRIAD_COMMUNICATOR_C_TEMPLATE.get(),
             final_params)
         # Render templates to file
         self._makefile_tmpl.render_to_file()
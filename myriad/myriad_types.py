@@ -17,7 +17,6 @@ subclasses is provided for normal use (e.g. MVoid, MInt, etc.)
 """
 
 from collections import OrderedDict
-import copy
 import inspect
 from warnings import warn
 
@@ -92,6 +91,22 @@ _C_DECL_MAPPING = {
 }
 
 
+def _clone_declarator(node):
+    """
+    Copies the declarator nodes (type/pointer/array declarations) of a C AST
+    type, sharing the underlying base type node which is never modified.
+    """
+    if isinstance(node, TypeDecl):
+        return TypeDecl(node.declname, list(node.quals), node.type, node.coord)
+    if isinstance(node, PtrDecl):
+        return PtrDecl(list(node.quals), _clone_declarator(node.type),
+                       node.coord)
+    if isinstance(node, ArrayDecl):
+        return ArrayDecl(_clone_declarator(node.type), node.dim,
+                         list(node.dim_quals), node.coord)
+    return node
+
+
 def c_decl_to_pybuildarg(c_decl: Decl):
     """ Returns the Py_BuildValue character associated with the declaration """
     if c_decl is None:
@@ -312,8 +327,10 @@ class MyriadStructType(_MyriadBase):
         :raises AssertionError: if members are not _MyriadBase subclassed
         """
 
+        members = OrderedDict() if members is None else members
+
         # Make sure we got the right parameter types
-        assert_list_type(list(members.values()), _MyriadBase)
+        assert_list_type(members.values(), _MyriadBase)
 
         #: Struct type identifier, i.e. the name after 'struct' in C.
         self.struct_name = struct_name
@@ -321,18 +338,15 @@ class MyriadStructType(_MyriadBase):
         #: Ordered members of the struct, derived from _MyriadBase.
         self.members = OrderedDict()
 
-        members = OrderedDict() if members is None else members
-
         # Store member type information for introspection. Non-ordered.
         self.member_type_info = {}
+
+        # Set struct members in a single pass: order matters for memory!
+        sorted_members = []
         for scalar in members.values():
             self.member_type_info[scalar.ident] = scalar
-
-        # Set struct members using ordered dict: order matters for memory!
-        sorted_members = [members[idx].decl for idx in members.keys()]
-        members = {v.ident: v.decl for v in members.values()}
-        for member_ident, member in members.items():
-            self.members[member_ident] = member
+            self.members[scalar.ident] = scalar.decl
+            sorted_members.append(scalar.decl)
 
         #: pycparser C AST struct node.
         self.struct_c_ast = Struct(self.struct_name, sorted_members)
@@ -478,7 +492,7 @@ class MyriadFunction(_MyriadBase):
         # ------------------------------------------
         # Create internal c_ast function declaration
         # ------------------------------------------
-        _tmp_decl = copy.deepcopy(self.ret_var.decl.type)
+        _tmp_decl = _clone_declarator(self.ret_var.decl.type)
 
         # Make sure we override the identifier in our copy
         if isinstance(_tmp_decl, PtrDecl):
@@ -497,8 +511,13 @@ class MyriadFunction(_MyriadBase):
                          init=None,
                          bitsize=None)
 
+        #: Cached result of stringify_decl; the declaration never changes.
+        self._decl_str = None
+
         #: C AST typedef, must be generated using gen_typedef.
         self.fun_typedef = None
+        #: Cached result of stringify_typedef, reset by gen_typedef.
+        self._typedef_str = None
         #: Typedef name defaults to ident + "_t"
         self.typedef_name = self.ident + "_t"
         #: Underlying MyriadCType for this function (based on typedef).
@@ -608,10 +627,19 @@ class MyriadFunction(_MyriadBase):
                                    storage=['typedef'],
                                    type=_tmp_fdecl,
                                    coord=None)
+        self._typedef_str = None
+
+    def stringify_decl(self) -> str:
+        """ Renders the C declaration, caching it for later calls """
+        if self._decl_str is None:
+            self._decl_str = super().stringify_decl()
+        return self._decl_str
 
     def stringify_typedef(self) -> str:
         """ Returns string representation of this function's typedef. """
-        return self._cgen.visit(self.fun_typedef)
+        if self._typedef_str is None:
+            self._typedef_str = self._cgen.visit(self.fun_typedef)
+        return self._typedef_str
 
     def stringify_def(self) -> str:
         """ Returns string representation of this function's definition. """
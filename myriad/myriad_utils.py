@@ -5,7 +5,6 @@ Collection of internal utility metaclasses and function annotations.
 """
 from functools import wraps
 from inspect import getcallargs
-from copy import copy
 from collections import OrderedDict
 
 
@@ -104,47 +103,48 @@ def enforce_annotations(fun):
 class OrderedSet(object):
     """
     Set that remembers the order elements were added.
+
+    Backed by a dict, which preserves insertion order and gives native hash
+    lookups for membership tests.
     """
 
-    def __init__(self, contents: list=None):
+    def __init__(self, contents=None):
         if contents is None:
             contents = []
-        self._backing_set = set(contents)
-        self._elements_ordered = contents
+        self._map = dict.fromkeys(contents)
 
     @property
     def backing_set(self):
         """ Returns a shallow copy of the backing set """
-        return copy(self._backing_set)
+        return set(self._map)
 
     def __iter__(self):
-        return self._elements_ordered.__iter__()
+        return iter(self._map)
 
     def __eq__(self, other):
         if hasattr(other, "backing_set"):
-            return self._backing_set == other.backing_set
+            return self._map.keys() == other.backing_set
         else:
             raise TypeError("Invalid comparison type for OrderedSet: ",
                             other.__class__)
 
     def add(self, item):
         """ Adds the item to the backing set """
-        if item in self._backing_set:
+        if item in self._map:
             raise ValueError("Item '${0}' already in OrderedSet".format(item))
-        self._backing_set.add(item)
-        self._elements_ordered.append(item)
+        self._map[item] = None
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
-    def __hash__(self):
-        return self._backing_set.__hash__()
+    # Mutable, and thus unhashable, just like the builtin set
+    __hash__ = None
 
     def __len__(self):
-        return len(self._backing_set)
+        return len(self._map)
 
     def __contains__(self, item):
-        return self._backing_set.__contains__(item)
+        return item in self._map
 
     def isdisjoint(self, other):
         """
@@ -152,10 +152,10 @@ class OrderedSet(object):
         OrderedSets are disjoint if and only if their intersection is the empty
         set.
         """
-        return self._backing_set.isdisjoint(other.backing_set)
+        return self._map.keys().isdisjoint(other)
 
     def __le__(self, other):
-        return self._backing_set <= other.backing_set
+        return self._map.keys() <= other.backing_set
 
     def issubset(self, other):
         """
@@ -168,26 +168,22 @@ class OrderedSet(object):
         Test whether the set is a proper subset of other, that is, set <= other
         and set != other.
         """
-        return self._backing_set < other.backing_set
+        return self._map.keys() < other.backing_set
 
     def __ge__(self, other):
-        return self._backing_set >= other.backing_set
+        return self._map.keys() >= other.backing_set
 
     def issuperset(self, other):
         """ Test whether every element in other is in the set. """
         return self.__ge__(other)
 
     def __gt__(self, other):
-        return self._backing_set > other.backing_set
+        return self._map.keys() > other.backing_set
 
     def __or__(self, other):
-        new_backing_set = copy(self._backing_set)
-        new_backing_set_list = copy(self._elements_ordered)
-        for other_val in other.backing_set:
-            if other_val not in new_backing_set:
-                new_backing_set.add(other_val)
-                new_backing_set_list.append(other_val)
-        return OrderedSet(new_backing_set_list)
+        new_set = type(self)()
+        new_set._map = {**self._map, **dict.fromkeys(other)}
+        return new_set
 
     def union(self, other):
         """
@@ -196,26 +192,14 @@ class OrderedSet(object):
         return self.__or__(other)
 
     def __and__(self, other):
-        new_backing_set = set()
-        new_backing_set_list = list()
-        for our_val in self._elements_ordered:
-            if our_val in other:
-                new_backing_set.add(our_val)
-                new_backing_set_list.append(our_val)
-        return OrderedSet(new_backing_set_list)
+        return type(self)(val for val in self._map if val in other)
 
     def intersection(self, other):
         """ Return a new set with elements common to the set and all others """
         return self.__and__(other)
 
     def __sub__(self, other):
-        new_backing_set = set()
-        new_backing_set_list = list()
-        for our_val in self._elements_ordered:
-            if our_val not in other:
-                new_backing_set.add(our_val)
-                new_backing_set_list.append(our_val)
-        return OrderedSet(new_backing_set_list)
+        return type(self)(val for val in self._map if val not in other)
 
     def difference(self, other):
         """
@@ -224,21 +208,16 @@ class OrderedSet(object):
         return self.__sub__(other)
 
     def __xor__(self, other):
-        new_backing_set_list = list()
         # Get all elements together first, then only add unique ones
         union_set = self.union(other)
-        for union_val in union_set:
-            in_ours = union_val in self
-            in_other = union_val in other
-            if in_ours ^ in_other:
-                new_backing_set_list.append(union_val)
-        return OrderedSet(new_backing_set_list)
+        return type(self)(val for val in union_set
+                          if (val in self) ^ (val in other))
 
     def __repr__(self):
-        return str(self._elements_ordered)
+        return str(list(self._map))
 
     def __str__(self):
-        return str(self._elements_ordered)
+        return str(list(self._map))
 
     def symmetric_difference(self, other):
         """
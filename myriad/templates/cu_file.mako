@@ -17,6 +17,7 @@
 ## Process instance methods
 <%
 instance_methods = [m.from_myriad_func(m, obj_name + "_" + m.ident) for m in myriad_methods.values()]
+our_subclass_set = frozenset(our_subclasses)
 %>
 
 ## Global vtables - pre-computed for MyriadObject
@@ -36,7 +37,7 @@ const ${method.typedef_name} ${method.ident}_vtable[NUM_CU_CLASS] = {
     ## the subclass has overwritten the method. Otherwise, use the subclass' version
     ## of our method
     % for cclass in myriad_classes:
-        % if cclass.obj_name == obj_name or cclass in our_subclasses:
+        % if cclass.obj_name == obj_name or cclass in our_subclass_set:
             % if method.ident not in cclass.myriad_methods:
             &${obj_name}_${method.ident},
             % else:
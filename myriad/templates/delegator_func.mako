@@ -3,12 +3,9 @@
     delegator - MyriadFunction object representing the base delegator
     classname - Name of the class this is implemented for as a string
     MVoid - myriad_types' MVoid type, passed by reference to avoid importing
+    fun_args - Comma-separated identifiers of all but the first argument
 </%doc>
 <%
-    ## Get the function arguments as a comma-seperated list
-    fun_args = ','.join([arg.ident for arg in delegator.args_list.values()][1:])
-    ## Get the 'class' argument (usually '_class')
-    class_arg = list(delegator.args_list.values())[0].ident
     ## Get the return type of this function
     ret_var = delegator.ret_var
     ## Get the name of the vtable
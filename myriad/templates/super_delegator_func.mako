@@ -4,12 +4,10 @@
     super_delegator - MyriadFunction object representing this function
     classname - Name of the class this is implemented for as a string
     MVoid - myriad_types' MVoid type, passed by reference to avoid importing
+    class_arg - Identifier of the 'class' argument (usually '_class')
+    fun_args - Comma-separated identifiers of the remaining arguments
 </%doc>
 <%
-    ## Get the function arguments as a comma-seperated list
-    fun_args = ','.join([arg.ident for arg in super_delegator.args_list.values()][1:])
-    ## Get the 'class' argument (usually '_class')
-    class_arg = list(super_delegator.args_list.values())[0].ident
     ## Get the return variable type of this function
     ret_var = super_delegator.ret_var
     ## Get the name of the vtable
@@ -0,0 +1,126 @@
+"""
+Test cases for myriad_mako_wrapper.
+:author Pedro Rittner
+"""
+
+import os
+import stat
+import unittest
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from context import myriad
+from myriad import myriad_mako_wrapper as mwrapper
+
+
+class TestTemplateModuleDirectory(unittest.TestCase):
+    """ Test cases for the compiled template cache directory """
+
+    def test_cache_disabled_by_default(self):
+        """ Testing that template modules aren't cached unless asked to """
+        with mock.patch.dict(os.environ, clear=True):
+            self.assertIsNone(mwrapper.template_module_directory())
+
+    def test_cache_dir_is_private(self):
+        """ Testing that the cache directory is created private to the user """
+        with TemporaryDirectory() as cache_home:
+            with mock.patch.dict(os.environ,
+                                 {"MYRIAD_TEMPLATE_CACHE": "1",
+                                  "XDG_CACHE_HOME": cache_home}):
+                module_dir = mwrapper.template_module_directory()
+            self.assertEqual(module_dir, os.path.join(cache_home, "myriad"))
+            self.assertEqual(stat.S_IMODE(os.stat(module_dir).st_mode), 0o700)
+
+    def test_shared_cache_dir_rejected(self):
+        """ Testing that a cache directory others can write to is not used """
+        with TemporaryDirectory() as cache_home:
+            os.mkdir(os.path.join(cache_home, "myriad"), 0o777)
+            os.chmod(os.path.join(cache_home, "myriad"), 0o777)
+            with mock.patch.dict(os.environ,
+                                 {"MYRIAD_TEMPLATE_CACHE": "1",
+                                  "XDG_CACHE_HOME": cache_home}):
+                with self.assertWarns(UserWarning):
+                    module_dir = mwrapper.template_module_directory()
+            self.assertIsNone(module_dir)
+
+
+class TestMakoFileTemplate(unittest.TestCase):
+    """ Test cases for rendering templates to files """
+
+    def test_failed_render_leaves_no_file(self):
+        """ Testing that a template failing midway doesn't create a file """
+        with TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "out.c")
+            template = mwrapper.MakoFileTemplate(
+                filename, "int a;\n${x.foo}\n", {"x": 1})
+            with self.assertRaises(AttributeError):
+                template.render_to_file()
+            self.assertEqual(os.listdir(tmp_dir), [])
+
+    def test_failed_render_keeps_old_file(self):
+        """ Testing that a template failing midway keeps the previous file """
+        with TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "out.c")
+            with open(filename, "w") as filep:
+                filep.write("int b;\n")
+            template = mwrapper.MakoFileTemplate(
+                filename, "int a;\n${x.foo}\n", {"x": 1})
+            with self.assertRaises(AttributeError):
+                template.render_to_file()
+            self.assertEqual(os.listdir(tmp_dir), ["out.c"])
+            with open(filename) as filep:
+                self.assertEqual(filep.read(), "int b;\n")
+
+    def test_render_through_symlink(self):
+        """ Testing that rendering to a symlink updates the file it targets """
+        with TemporaryDirectory() as tmp_dir:
+            target = os.path.join(tmp_dir, "real.c")
+            with open(target, "w") as filep:
+                filep.write("int b;\n")
+            link = os.path.join(tmp_dir, "out.c")
+            os.symlink(target, link)
+            mwrapper.MakoFileTemplate(link, "int a;\n").render_to_file()
+            self.assertTrue(os.path.islink(link))
+            with open(target) as filep:
+                self.assertEqual(filep.read(), "int a;\n")
+
+    def test_new_file_mode(self):
+        """ Testing that new files get the usual umask-based permissions """
+        with TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "out.c")
+            mwrapper.MakoFileTemplate(filename, "int a;\n").render_to_file()
+            umask = os.umask(0)
+            os.umask(umask)
+            self.assertEqual(stat.S_IMODE(os.stat(filename).st_mode),
+                             0o666 & ~umask)
+
+    def test_unchanged_file_not_rewritten(self):
+        """ Testing that re-rendering identical content keeps the file """
+        with TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "out.c")
+            template = mwrapper.MakoFileTemplate(
+                filename, "int ${name};\n", {"name": "a"})
+            template.render_to_file()
+            os.utime(filename, (0, 0))
+            template.render_to_file()
+            self.assertEqual(os.stat(filename).st_mtime, 0)
+            template.context = {"name": "b"}
+            template.render_to_file()
+            self.assertNotEqual(os.stat(filename).st_mtime, 0)
+            with open(filename) as filep:
+                self.assertEqual(filep.read(), "int b;\n")
+
+    def test_undecodable_file_overwritten(self):
+        """ Testing that an existing file in another encoding is replaced """
+        with TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "out.c")
+            with open(filename, "wb") as filep:
+                filep.write(b"\xff\xfe\x00")
+            template = mwrapper.MakoFileTemplate(filename, "int a;\n")
+            template.render_to_file()
+            with open(filename) as filep:
+                self.assertEqual(filep.read(), "int a;\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,7 @@
 .. moduleauthor:: Pedro Rittner <pr273@cornell.edu>
 """
 
+import os
 import unittest
 
 from collections import OrderedDict
@@ -15,6 +16,7 @@ from myriad_testing import set_external_loggers, MyriadTestCase
 from context import myriad
 from myriad import myriad_types
 from myriad import myriad_metaclass
+from myriad import myriad_object
 
 
 @set_external_loggers("TestMyriadMethod", myriad_metaclass.LOG)
@@ -42,6 +44,17 @@ class TestMyriadMethod(MyriadTestCase):
         """
         self.assertTrimStrEquals(str(super_delg), expected_result)
 
+    def test_create_super_delegator_class_arg(self):
+        """ Testing super delegators reject a parameter named _class """
+        args_list = OrderedDict()
+        args_list["self"] = myriad_types.MyriadScalar(
+            "self", myriad_types.MVoid, True, quals=["const"])
+        args_list["_class"] = myriad_types.MyriadScalar(
+            "_class", myriad_types.MInt)
+        myriad_fxn = myriad_types.MyriadFunction("set_class", args_list)
+        with self.assertRaises(ValueError):
+            myriad_metaclass.create_super_delegator(myriad_fxn, "Compartment")
+
     def test_create_delegator(self):
         """ Testing if creating delegators works """
         # Create scalars and function
@@ -67,5 +80,77 @@ class TestMyriadMethod(MyriadTestCase):
         """
         self.assertTrimStrEquals(str(result_fxn), expected_result)
 
+
+try:
+    from myriad import _metaclass_hot
+except ImportError:
+    # make test-cython builds the extension and insists on testing it
+    if os.environ.get("MYRIAD_REQUIRE_CYTHON"):
+        raise
+    _metaclass_hot = None
+
+
+def _sample_namespace() -> OrderedDict:
+    """ Class namespace exercising every kind of entry the parser handles """
+    namespace = OrderedDict()
+    namespace["__module__"] = __name__
+    namespace["capacitance"] = myriad_types.MDouble
+    namespace["mech"] = myriad_types.MyriadScalar(
+        "mech", myriad_types.MVoid, ptr=True)
+    namespace["vm"] = myriad_types.MyriadTimeseriesVector
+    namespace["unsupported"] = 42
+
+    def helper(self):
+        return 0
+    namespace["helper"] = helper
+
+    @myriad_metaclass.myriad_method_verbatim
+    def do_stuff(self):
+        """return;"""
+    namespace["do_stuff"] = do_stuff
+
+    @myriad_metaclass.myriad_method_verbatim
+    def ctor(self):
+        """return self;"""
+    namespace["ctor"] = ctor
+    return namespace
+
+
+@unittest.skipIf(_metaclass_hot is None, "_metaclass_hot extension not built")
+class TestMetaclassHotPath(unittest.TestCase):
+    """
+    Tests that the Cython hot path matches the pure-Python implementation
+    """
+
+    def _parse(self, parse_fun):
+        """ Parses the sample namespace with the given implementation """
+        methods, obj_vars = OrderedDict(), OrderedDict()
+        parse_fun(_sample_namespace(), "Sample", methods, obj_vars)
+        return (list(methods.keys()),
+                [(k, v.stringify_decl()) for k, v in obj_vars.items()])
+
+    def test_parse_namespace(self):
+        """ Testing both _parse_namespace versions give the same result """
+        self.assertEqual(
+            self._parse(_metaclass_hot._parse_namespace),
+            self._parse(myriad_metaclass._py_parse_namespace))
+
+    def _organize(self, organizer_fun):
+        """ Organizes the sample methods with the given implementation """
+        methods, obj_vars = OrderedDict(), OrderedDict()
+        myriad_metaclass._py_parse_namespace(
+            _sample_namespace(), "Sample", methods, obj_vars)
+        own_methods = organizer_fun(myriad_object.MyriadObject, methods)
+        return ([m.ident for m in own_methods],
+                [(k, v.stringify_decl(), v.stringify_def())
+                 for k, v in methods.items()])
+
+    def test_method_organizer_helper(self):
+        """ Testing both _method_organizer_helper versions agree """
+        self.assertEqual(
+            self._organize(_metaclass_hot._method_organizer_helper),
+            self._organize(myriad_metaclass._py_method_organizer_helper))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -6,7 +6,9 @@
 .. moduleauthor:: Pedro Rittner <pr273@cornell.edu>
 """
 
+import os
 import unittest
+from tempfile import TemporaryDirectory
 
 from myriad_testing import set_external_loggers, MyriadTestCase
 
@@ -88,6 +90,17 @@ class TestMyriadMetaclass(MyriadTestCase):
         self.assertTrue(hasattr(inst, "dummy"))
         self.assertEqual(getattr(inst, "dummy"), 3.0)
 
+    def test_myriad_attributes(self):
+        """ Testing class declarations and instance attributes coexist """
+        class AttrObject(mobject.MyriadObject):
+            dummy = mtypes.MDouble
+        inst = AttrObject(dummy=3.0)
+        self.assertIs(AttrObject.dummy, mtypes.MDouble)
+        self.assertEqual(getattr(inst, "dummy"), 3.0)
+        # Extra attributes are stored (with a warning), not rejected
+        inst.extra = 3
+        self.assertEqual(getattr(inst, "extra"), 3)
+
     def test_myriad_invalid_init(self):
         """ Testing creating Myriad object with invalid constructor calls """
         class InstanceObject(mobject.MyriadObject):
@@ -144,6 +157,27 @@ class TestMyriadRendering(MyriadTestCase):
         self.assertFilesExist(TimeseriesObj)
         # self.cleanupFiles(TimeseriesObj)
 
+    def test_render_output_subset(self):
+        """ Testing if rendering a subset of outputs renders only those """
+        class SubsetObj(mobject.MyriadObject):
+            capacitance = mtypes.MDouble
+        template_dir = TemporaryDirectory()
+        self.addCleanup(template_dir.cleanup)
+        SubsetObj.render_templates(template_dir, outputs=("cuh",))
+        self.assertEqual(sorted(os.listdir(template_dir.name)),
+                         ["MyriadObject.cuh", "SubsetObj.cuh"])
+
+    def test_render_unknown_output(self):
+        """ Testing if rendering an unknown output kind is rejected """
+        class UnknownOutputObj(mobject.MyriadObject):
+            capacitance = mtypes.MDouble
+        template_dir = TemporaryDirectory()
+        self.addCleanup(template_dir.cleanup)
+        with self.assertRaises(ValueError):
+            UnknownOutputObj.render_templates(template_dir,
+                                              outputs=("h", "c"))
+        self.assertEqual(os.listdir(template_dir.name), [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -46,6 +46,18 @@ class TestFunctions(unittest.TestCase):
         self.assertEqual("typedef void (*dtor_t)(const void *self)",
                          dtor.stringify_typedef())
 
+    def test_function_typedef_regenerated(self):
+        """ Testing regenerating a function typedef after renaming it """
+        void_ptr = mtypes.MyriadScalar(
+            "self", mtypes.MVoid, True, quals=["const"])
+        dtor = mtypes.MyriadFunction("dtor", OrderedDict({0: void_ptr}))
+        self.assertEqual("typedef void (*dtor_t)(const void *self)",
+                         dtor.stringify_typedef())
+        dtor.typedef_name = "destructor_t"
+        dtor.gen_typedef()
+        self.assertEqual("typedef void (*destructor_t)(const void *self)",
+                         dtor.stringify_typedef())
+
 
 class TestStructs(unittest.TestCase):
     """